@@ -10,6 +10,10 @@ logging_format = "%(asctime)s: %(message)s"
 logging.basicConfig(format=logging_format, level=logging.INFO,
                     datefmt="%H:%M:%S")
 
+# Bus accesses and the helpers called on every loop of a consumer-producer log through this logger,
+# guarded by a level check, rather than through log decorators that format their message on every call
+logger = logging.getLogger(__name__)
+
 
 class Bus:
     """
@@ -26,24 +30,24 @@ class Bus:
         # Set up the class so that functions can get a lock while working
         self.lock = rwlock.RWLockFairD()
 
-    @log_on_start(DEBUG, "{self.name:s}: Initiating read by {_name:s}")
-    @log_on_error(DEBUG, "{self.name:s}: Error on read by {_name:s}")
-    @log_on_end(DEBUG, "{self.name:s}: Finished read by {_name:s}")
     def get_message(self, _name='Unspecified function'):
 
         with self.lock.gen_rlock():
             message = self.message
 
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Read by {_name:s}")
+
         return message
 
-    @log_on_start(DEBUG, "{self.name:s}: Initiating write by {_name:s}")
-    @log_on_error(DEBUG, "{self.name:s}: Error on write by {_name:s}")
-    @log_on_end(DEBUG, "{self.name:s}: Finished write by {_name:s}")
     def set_message(self, message, _name='Unspecified function'):
 
         with self.lock.gen_wlock():
             self.message = message
 
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Write by {_name:s}")
+
 
 def ensureTuple(value):
     """
@@ -84,11 +88,25 @@ class ConsumerProducer:
         self.termination_buses = ensureTuple(termination_buses)
         self.name = name
 
+        # Reusable list that the input bus values are collected into on each loop
+        self.input_values = [None] * len(self.input_buses)
+
+        # The number of output buses is fixed at this point, so choose the
+        # dealing strategy once instead of re-checking it on every loop
+        if len(self.output_buses) == 1:
+            self.dealOutputValues = self.dealValueToOneBus
+        else:
+            self.dealOutputValues = self.dealValuesToManyBuses
+
     @log_on_start(DEBUG, "{self.name:s}: Starting consumer-producer service")
     @log_on_error(DEBUG, "{self.name:s}: Encountered an error while executing consumer-producer")
     @log_on_end(DEBUG, "{self.name:s}: Closing down consumer-producer service")
     def __call__(self):
 
+        # Time at which the next cycle is due. Scheduling against this deadline keeps the time spent
+        # doing the work in each cycle from adding to the delay between cycles
+        next_time = time.monotonic()
+
         while True:
 
             # Check if the loop should terminate
@@ -97,22 +115,24 @@ class ConsumerProducer:
                 break
 
             # Collect all of the values from the input buses into a list
-            input_values = self.collectbusesToValues(self.input_buses)
+            input_values = self.collectInputValues()
 
             # Get the output value or tuple of values corresponding to the inputs
             output_values = self.consumer_producer_function(*input_values)
 
             # Deal the values into the output buses
-            self.dealValuesTobuses(output_values, self.output_buses)
+            self.dealOutputValues(output_values)
 
-            # Pause for set amount of time
-            time.sleep(self.delay)
+            # Pause until the next cycle is due. If the loop has fallen more than two cycles behind, count
+            # from now instead of running back-to-back cycles to catch up
+            next_time += self.delay
+            now = time.monotonic()
+            if now - next_time > 2 * self.delay:
+                next_time = now
+            time.sleep(max(0, next_time - now))
 
     # Take in a bus or a tuple of buses, and store their
     # messages into a list
-    @log_on_start(DEBUG, "{self.name:s}: Starting collecting bus values into list")
-    @log_on_error(DEBUG, "{self.name:s}: Encountered an error while collecting bus values")
-    @log_on_end(DEBUG, "{self.name:s}: Finished collecting bus values")
     def collectbusesToValues(self, buses):
 
         # Wrap buses in a tuple if it isn't one already
@@ -125,13 +145,26 @@ class ConsumerProducer:
         for p in buses:
             values.append(p.get_message(self.name))
 
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Collected bus values into list")
+
         return values
 
+    # Read the input buses of this consumer-producer into its reusable
+    # input value list
+    def collectInputValues(self):
+
+        input_values = self.input_values
+        for idx, p in enumerate(self.input_buses):
+            input_values[idx] = p.get_message(self.name)
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Collected input bus values into list")
+
+        return input_values
+
     # Take in  a tuple of values and a tuple of buses, and deal the values
     # into the buses
-    @log_on_start(DEBUG, "{self.name:s}: Starting dealing values into buses")
-    @log_on_error(DEBUG, "{self.name:s}: Encountered an error while dealing values into buses")
-    @log_on_end(DEBUG, "{self.name:s}: Finished dealing values into buses")
     def dealValuesTobuses(self, values, buses):
 
         # Wrap buses in a tuple if it isn't one already
@@ -157,19 +190,49 @@ class ConsumerProducer:
         for idx, v in enumerate(values):
             buses[idx].set_message(v, self.name)
 
-    @log_on_start(DEBUG, "{self.name:s}: Starting to check termination buses")
-    @log_on_error(DEBUG, "{self.name:s}: Encountered an error while checking termination buses")
-    @log_on_end(DEBUG, "{self.name:s}: Finished checking termination buses")
-    def checkTerminationbuses(self):
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Dealt values into buses")
+
+    # Specialized versions of dealValuesTobuses for the output buses of this
+    # consumer-producer, one of which is selected in __init__
+    def dealValueToOneBus(self, value):
 
-        # Look at all of the termination buses
-        termination_bus_values = self.collectbusesToValues(self.termination_buses)
+        # A single bus receives the values as a single entity
+        self.output_buses[0].set_message(value, self.name)
 
-        # If any of the termination buses have triggered (gone true or non-negative), signal the loop to end
-        for tbv in termination_bus_values:
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Dealt value into output bus")
+
+    def dealValuesToManyBuses(self, values):
+
+        # Values presented as a tuple are dealt one per bus, anything else is
+        # copied into every bus
+        if isinstance(values, tuple):
+            for idx, v in enumerate(values):
+                self.output_buses[idx].set_message(v, self.name)
+        else:
+            for bus in self.output_buses:
+                bus.set_message(values, self.name)
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Dealt values into output buses")
+
+    def checkTerminationbuses(self):
+
+        # Look at the termination buses one at a time. If any of them has triggered (gone true or
+        # non-negative), signal the loop to end without reading the rest
+        for p in self.termination_buses:
+            tbv = p.get_message(self.name)
             if tbv and tbv >= 0:
+                if logger.isEnabledFor(DEBUG):
+                    logger.debug(f"{self.name:s}: Termination bus {p.name:s} has triggered")
                 return True
 
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Checked termination buses")
+
+        return False
+
 
 class Producer(ConsumerProducer):
     """
@@ -263,20 +326,21 @@ class Timer(Producer):
             name)
 
         self.duration = duration
-        self.t_start = time.time()
+        self.t_start = time.monotonic()
 
-    @log_on_start(DEBUG, "{self.name:s}: Checking current time against starting time")
-    @log_on_error(DEBUG, "{self.name:s}: Encountered an error while checking current time against starting time")
-    @log_on_end(DEBUG, "{self.name:s}: Finished checking current time against starting time")
     def timer(self):
 
         # Trigger the timer if the duration is non-zero and the time elapsed
         # since instantiation is longer than the duration
         if self.duration:
-            time_relative_to_end_time = time.time() - self.t_start - self.duration
-            return time_relative_to_end_time
+            time_relative_to_end_time = time.monotonic() - self.t_start - self.duration
         else:
-            return False
+            time_relative_to_end_time = False
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Checked current time against starting time")
+
+        return time_relative_to_end_time
 
 
 class Printer(Consumer):
@@ -303,23 +367,25 @@ class Printer(Consumer):
 
         self.print_prefix = print_prefix
 
+        # Build the output format once: the prefix (with any braces escaped so that it prints as plain
+        # text) followed by one 11-character column per bus, each preceded by a space
+        self.print_format = (print_prefix.replace("{", "{{").replace("}", "}}")
+                             + " {:<11}" * len(self.input_buses))
+
     def print_bus(self, *messages):
-        output_string = self.print_prefix                  # Start the output string with the print prefix
-        for msg in messages:                               # Append bus messages to the output
+        msg_strs = []
+        for msg in messages:                               # Convert each bus message to a string
 
             if isinstance(msg, str):                       # If the message is a string, leave it as it is
                 msg_str = msg
             else:                                          # If it's not a string, assume it's a number and convert it
-                msg_str = str("{0:.4g}".format(msg))       # Convert to string with 4 significant figures
+                msg_str = "{0:.4g}".format(msg)            # Convert to string with 4 significant figures
                 if msg >= 0:                               # Append a space before the value if it is not negative
                     msg_str = " " + msg_str
 
-            output_string = output_string + " " + msg_str  # Append the message string to the output string
-
-            for i in range(1, 12 - len(msg_str)):          # Add spacing to put the outputs into columns
-                output_string = output_string + " "
+            msg_strs.append(msg_str)
 
-        print(output_string)                               # Print the formatted output
+        print(self.print_format.format(*msg_strs))         # Print the messages in columns after the prefix
 
 
 @log_on_start(DEBUG, "runConcurrently: Starting concurrent execution")
@@ -18,8 +18,8 @@ and expect your code to run as before (assuming that you haven't incorporated an
 the threading architecture from concurrent.futures).
 
 While running RossROS AsyncIO, you can include calls to "await.sleep" within the consumer and producer functions
-(but note that any such calls will stack with the loop delay time, so that you should decrease the loop delay
-to keep the same overall execution frequency).
+(the loop delay is measured from the start of each cycle, so time spent in such calls is absorbed into the delay
+rather than added to it, as long as the cycle finishes within the delay).
 
 --
 
@@ -36,6 +36,16 @@ Third, it replaces the runConcurrently function with a version that uses the asy
 
 from rossros import *
 import asyncio
+import logging
+import time
+
+# uvloop is an optional drop-in replacement for the default asyncio event loop, with lower overhead per await
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger(__name__)
 
 
 """ First Change: For asyncio, locking is handled manually, so the Bus class does not the the RWLock code"""
@@ -50,19 +60,20 @@ class Bus:
         self.message = initial_message
         self.name = name
 
-    @log_on_start(DEBUG, "{self.name:s}: Initiating read by {_name:s}")
-    @log_on_error(DEBUG, "{self.name:s}: Error on read by {_name:s}")
-    @log_on_end(DEBUG, "{self.name:s}: Finished read by {_name:s}")
     def get_message(self, _name):
         message = self.message
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Read by {_name:s}")
+
         return message
 
-    @log_on_start(DEBUG, "{self.name:s}: Initiating write by {_name:s}")
-    @log_on_error(DEBUG, "{self.name:s}: Error on write by {_name:s}")
-    @log_on_end(DEBUG, "{self.name:s}: Finished write by {_name:s}")
     def set_message(self, message, _name):
         self.message = message
 
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"{self.name:s}: Write by {_name:s}")
+
 
 """"
 Second Change: the __call__ method for ConsumerProducer and its child classes needs to be an async function
@@ -71,142 +82,76 @@ and have an "await asyncio.sleep" call instead of time.sleep.
 The "from rossros import *" call at the beginning of the file brings all items in the rossros namespace into the
 rossros_asyncio namespace. Declaring classes in rossros_asyncio that inherit from their same-named classes in rossros
 then allows us to redefine the __call__ method to be asyncio-aware.
-"""
 
+The child classes inherit from their rossros counterparts rather than from the ConsumerProducer defined here, so
+they pick up the asyncio-aware __call__ method by assigning it directly instead of repeating its definition.
+"""
 
-class ConsumerProducer(ConsumerProducer):
-
-    @log_on_start(DEBUG, "{self.name:s}: Starting consumer-producer service")
-    @log_on_error(DEBUG, "{self.name:s}: Encountered an error while closing down consumer-producer")
-    @log_on_end(DEBUG, "{self.name:s}: Closing down consumer-producer service")
-    async def __call__(self):
-
-        while True:
-
-            # Check if the loop should terminate
-            # termination_value = self.termination_buses[0].get_message(self.name)
-            if self.checkTerminationbuses():
-                break
-
-            # Collect all of the values from the input buses into a list
-            input_values = self.collectbusesToValues(self.input_buses)
-
-            # Get the output value or tuple of values corresponding to the inputs
-            output_values = self.consumer_producer_function(*input_values)
-
-            # Deal the values into the output buses
-            self.dealValuesTobuses(output_values, self.output_buses)
 
-            # Pause for set amount of time
-            await asyncio.sleep(self.delay)
+# Number of loop iterations a consumer-producer runs between yields to the event loop
+# when there is no delay between its cycles
+ZERO_DELAY_ITERATIONS_PER_YIELD = 64
 
 
-class Producer(Producer):
+class ConsumerProducer(ConsumerProducer):
 
     @log_on_start(DEBUG, "{self.name:s}: Starting consumer-producer service")
     @log_on_error(DEBUG, "{self.name:s}: Encountered an error while closing down consumer-producer")
     @log_on_end(DEBUG, "{self.name:s}: Closing down consumer-producer service")
     async def __call__(self):
 
-        while True:
-
-            # Check if the loop should terminate
-            # termination_value = self.termination_buses[0].get_message(self.name)
-            if self.checkTerminationbuses():
-                break
-
-            # Collect all of the values from the input buses into a list
-            input_values = self.collectbusesToValues(self.input_buses)
-
-            # Get the output value or tuple of values corresponding to the inputs
-            output_values = self.consumer_producer_function(*input_values)
-
-            # Deal the values into the output buses
-            self.dealValuesTobuses(output_values, self.output_buses)
+        # Bus reads and writes never wait on anything, so with no delay a batch of
+        # iterations can run before handing control back to the event loop
+        if self.delay:
+            iterations_per_yield = 1
+        else:
+            iterations_per_yield = ZERO_DELAY_ITERATIONS_PER_YIELD
 
-            # Pause for set amount of time
-            await asyncio.sleep(self.delay)
-
-
-class Consumer(Consumer):
-
-    @log_on_start(DEBUG, "{self.name:s}: Starting consumer-producer service")
-    @log_on_error(DEBUG, "{self.name:s}: Encountered an error while closing down consumer-producer")
-    @log_on_end(DEBUG, "{self.name:s}: Closing down consumer-producer service")
-    async def __call__(self):
+        # Time at which the next batch of iterations is due. Scheduling against this deadline keeps the
+        # time spent doing the work in each cycle from adding to the delay between cycles
+        next_time = time.monotonic()
 
         while True:
 
-            # Check if the loop should terminate
-            # termination_value = self.termination_buses[0].get_message(self.name)
-            if self.checkTerminationbuses():
-                break
-
-            # Collect all of the values from the input buses into a list
-            input_values = self.collectbusesToValues(self.input_buses)
-
-            # Get the output value or tuple of values corresponding to the inputs
-            output_values = self.consumer_producer_function(*input_values)
+            for _ in range(iterations_per_yield):
 
-            # Deal the values into the output buses
-            self.dealValuesTobuses(output_values, self.output_buses)
+                # Check if the loop should terminate
+                # termination_value = self.termination_buses[0].get_message(self.name)
+                if self.checkTerminationbuses():
+                    return
 
-            # Pause for set amount of time
-            await asyncio.sleep(self.delay)
+                # Collect all of the values from the input buses into a list
+                input_values = self.collectInputValues()
 
+                # Get the output value or tuple of values corresponding to the inputs
+                output_values = self.consumer_producer_function(*input_values)
 
-class Printer(Printer):
+                # Deal the values into the output buses
+                self.dealOutputValues(output_values)
 
-    @log_on_start(DEBUG, "{self.name:s}: Starting consumer-producer service")
-    @log_on_error(DEBUG, "{self.name:s}: Encountered an error while closing down consumer-producer")
-    @log_on_end(DEBUG, "{self.name:s}: Closing down consumer-producer service")
-    async def __call__(self):
+            # Pause until the next cycle is due. If the loop has fallen more than two cycles behind, count
+            # from now instead of running back-to-back cycles to catch up
+            next_time += self.delay
+            now = time.monotonic()
+            if now - next_time > 2 * self.delay:
+                next_time = now
+            await asyncio.sleep(max(0, next_time - now))
 
-        while True:
 
-            # Check if the loop should terminate
-            # termination_value = self.termination_buses[0].get_message(self.name)
-            if self.checkTerminationbuses():
-                break
+class Producer(Producer):
+    __call__ = ConsumerProducer.__call__
 
-            # Collect all of the values from the input buses into a list
-            input_values = self.collectbusesToValues(self.input_buses)
 
-            # Get the output value or tuple of values corresponding to the inputs
-            output_values = self.consumer_producer_function(*input_values)
+class Consumer(Consumer):
+    __call__ = ConsumerProducer.__call__
 
-            # Deal the values into the output buses
-            self.dealValuesTobuses(output_values, self.output_buses)
 
-            # Pause for set amount of time
-            await asyncio.sleep(self.delay)
+class Printer(Printer):
+    __call__ = ConsumerProducer.__call__
 
 
 class Timer(Timer):
-
-    @log_on_start(DEBUG, "{self.name:s}: Starting consumer-producer service")
-    @log_on_error(DEBUG, "{self.name:s}: Encountered an error while closing down consumer-producer")
-    @log_on_end(DEBUG, "{self.name:s}: Closing down consumer-producer service")
-    async def __call__(self):
-
-        while True:
-
-            # Check if the loop should terminate
-            # termination_value = self.termination_buses[0].get_message(self.name)
-            if self.checkTerminationbuses():
-                break
-
-            # Collect all of the values from the input buses into a list
-            input_values = self.collectbusesToValues(self.input_buses)
-
-            # Get the output value or tuple of values corresponding to the inputs
-            output_values = self.consumer_producer_function(*input_values)
-
-            # Deal the values into the output buses
-            self.dealValuesTobuses(output_values, self.output_buses)
-
-            # Pause for set amount of time
-            await asyncio.sleep(self.delay)
+    __call__ = ConsumerProducer.__call__
 
 
 """
@@ -235,6 +180,10 @@ async def gather(producer_consumer_list):
 def runConcurrently(producer_consumer_list):
     """
     Function that uses asyncio.run to tell asyncio.gather to run a list of
-    ConsumerProducers
+    ConsumerProducers (on a uvloop event loop, if uvloop is installed)
     """
-    asyncio.run(gather(producer_consumer_list))
+    # uvloop.run was added in uvloop 0.18, so older versions fall back to the default event loop
+    if uvloop is not None and hasattr(uvloop, "run"):
+        uvloop.run(gather(producer_consumer_list))
+    else:
+        asyncio.run(gather(producer_consumer_list))